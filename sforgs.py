@@ -6,38 +6,220 @@ A full-featured TUI application that streamlines Salesforce org management by
 providing administrators and developers with unified org visibility, session
 management, and quick access through a keyboard-driven workflow.
 
+This module holds the SF CLI integration, data processing and entry point.
+The Textual interface lives in `sforgs_tui` and is only imported when the
+TUI is started.
+
 Author: Bilal Bjo
 License: MIT
 Repository: https://github.com/Bilal-Bjo/SFORGS
 """
 
+import argparse
+import asyncio
 import json
+import operator
+import os
+import re
 import subprocess
 import sys
-from typing import Optional
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
 
-from textual import on, work
-from textual.app import App, ComposeResult
-from textual.binding import Binding
-from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import DataTable, Footer, Header, Input, Label, Static
-from textual.worker import Worker, WorkerState
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# =============================================================================
+# ORG LIST CACHE
+# =============================================================================
+
+CACHE_TTL = 60  # seconds
+SF_AUTH_DIRS = (Path.home() / ".sf", Path.home() / ".sfdx")
+
+
+def _cache_path() -> Path:
+    """Location of the on-disk `sf org list` cache."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    return cache_home / "sforgs" / "orgs.json"
+
+
+def _auth_mtime() -> float:
+    """Newest modification time across the SF CLI auth directories."""
+    newest = 0.0
+    for auth_dir in SF_AUTH_DIRS:
+        for path in (auth_dir, *auth_dir.glob("**/*.json")):
+            try:
+                newest = max(newest, path.stat().st_mtime)
+            except OSError:
+                continue
+    return newest
+
+
+def read_cache(max_age: Optional[float] = CACHE_TTL) -> Optional[dict]:
+    """Return the cached org list, or None if missing, expired or outdated.
+
+    Pass ``max_age=None`` to accept a stale copy regardless of age.
+    """
+    path = _cache_path()
+    try:
+        mtime = path.stat().st_mtime
+        if max_age is not None:
+            if time.time() - mtime >= max_age or mtime <= _auth_mtime():
+                return None
+        return _loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(org_data: dict) -> None:
+    """Atomically persist the org list to the on-disk cache."""
+    path = _cache_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(org_data, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
 
 
 # =============================================================================
 # SALESFORCE CLI INTERACTION
 # =============================================================================
 
-def get_sf_orgs() -> dict:
-    """Fetch all authenticated Salesforce orgs using the SF CLI."""
-    result = subprocess.run(
-        ["sf", "org", "list", "--json"],
-        capture_output=True,
-        text=True,
-        timeout=30
+ORG_LIST_CMD = ("sf", "org", "list", "--json")
+SKIP_STATUS_FLAG = "--skip-connection-status"
+
+
+def start_org_list(*extra_args: str) -> subprocess.Popen:
+    """Start `sf org list --json` before an event loop exists."""
+    return subprocess.Popen(
+        [*ORG_LIST_CMD, *extra_args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
     )
-    data = json.loads(result.stdout)
-    return data.get("result", {})
+
+
+async def _collect_org_list(process: subprocess.Popen) -> dict:
+    """Wait for a process from `start_org_list()`, killing it if cancelled."""
+    try:
+        stdout, _ = await asyncio.wait_for(
+            asyncio.to_thread(process.communicate), timeout=30
+        )
+    finally:
+        if process.poll() is None:
+            process.kill()
+    return await asyncio.to_thread(_loads, stdout)
+
+
+async def _run_org_list(*extra_args: str) -> dict:
+    """Run `sf org list --json`, killing it on timeout or cancellation."""
+    process = await asyncio.create_subprocess_exec(
+        *ORG_LIST_CMD,
+        *extra_args,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return await asyncio.to_thread(_loads, stdout)
+
+
+async def get_sf_orgs(
+    skip_cache: bool = False,
+    process: Optional[subprocess.Popen] = None,
+) -> tuple[dict, bool]:
+    """Fetch all authenticated Salesforce orgs using the SF CLI.
+
+    Connection checks are skipped so the listing stays fast; use
+    `check_org()` to confirm a single org's session on demand. Returns the
+    org data and whether it came from a stale cache because the CLI could
+    not be run. Cancelling the call terminates the CLI process.
+
+    ``process`` is an `sf org list` already started with `start_org_list()`;
+    its output is used instead of the cache or a new CLI call.
+    """
+    if process is None and not skip_cache:
+        cached = await asyncio.to_thread(read_cache)
+        if cached is not None:
+            return cached, False
+
+    try:
+        if process is not None:
+            data = await _collect_org_list(process)
+        else:
+            data = await _run_org_list(SKIP_STATUS_FLAG)
+        if data.get("status") != 0 and SKIP_STATUS_FLAG in data.get("message", ""):
+            # Older CLI versions do not know the flag
+            data = await _run_org_list()
+    except (asyncio.TimeoutError, FileNotFoundError):
+        cached = await asyncio.to_thread(read_cache, None)
+        if cached is None:
+            raise
+        return cached, True
+
+    org_data = data.get("result", {})
+    if data.get("status") == 0:
+        await asyncio.to_thread(write_cache, org_data)
+    return org_data, False
+
+
+AUTH_ERRORS = ("RefreshTokenAuthError", "NamedOrgNotFoundError", "NoAuthInfoFound")
+
+
+def _is_auth_error(data: dict) -> bool:
+    """Whether an SF CLI error response means the session itself is invalid."""
+    message = str(data.get("message", "")).lower()
+    return (
+        data.get("name") in AUTH_ERRORS
+        or "invalid_grant" in message
+        or "expired or revoked" in message
+        or "expired access/refresh token" in message
+    )
+
+
+def check_org(alias_or_username: str) -> Optional[bool]:
+    """Confirm an org's session with `sf org display`.
+
+    Returns False only for authentication errors, and None if the CLI could
+    not give an answer (network failures, other CLI errors).
+    """
+    try:
+        result = subprocess.run(
+            ["sf", "org", "display", "-o", alias_or_username, "--json"],
+            capture_output=True,
+            timeout=30
+        )
+        data = _loads(result.stdout)
+    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
+        return None
+    if data.get("status") != 0:
+        return False if _is_auth_error(data) else None
+    return data.get("result", {}).get("connectedStatus", "Connected") == "Connected"
+
+
+def warmup_cli() -> None:
+    """Run a cheap SF CLI command so Node and the CLI modules are cached."""
+    try:
+        subprocess.run(["sf", "--version"], capture_output=True, timeout=5)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        pass
 
 
 def open_org(alias_or_username: str) -> tuple[bool, str]:
@@ -68,6 +250,25 @@ def reauth_org(alias_or_username: str, is_sandbox: bool) -> tuple[bool, str]:
         return False, f"Re-authentication failed: {e}"
 
 
+def probe_org(org: dict) -> bool:
+    """Check that the org's instance answers HTTP requests."""
+    # Imported here: urllib.request pulls in ssl and http.client, which only
+    # --verify needs
+    import urllib.error
+    import urllib.request
+
+    if not org["instance_url"]:
+        return False
+    url = org["instance_url"].rstrip("/") + "/services/data/"
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.status < 500
+    except urllib.error.HTTPError as e:
+        return e.code < 500
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
+
+
 # =============================================================================
 # DATA PROCESSING
 # =============================================================================
@@ -83,412 +284,203 @@ def get_org_type(org: dict) -> str:
     return "Production"
 
 
-def parse_orgs(org_data: dict) -> list[dict]:
-    """Parse raw SF CLI org data into a unified, sorted list."""
+class OrgView:
+    """One row of an `OrgTable`, read and written through by field name."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "OrgTable", index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, field: str):
+        return self.table.columns[field][self.index]
+
+    def __setitem__(self, field: str, value) -> None:
+        self.table.columns[field][self.index] = value
+
+
+class OrgTable:
+    """Org records stored as parallel lists, one per field.
+
+    Searching walks the ``haystacks`` list alone instead of a dict per org;
+    ``table[i]`` returns an `OrgView` for code that needs a whole record.
+    """
+
+    FIELDS = (
+        "alias", "username", "type", "name", "status", "is_connected",
+        "instance_url", "is_default", "is_dev_hub", "is_sandbox", "_haystack",
+    )
+
+    def __init__(self, orgs: Iterable[dict] = ()) -> None:
+        self.columns: dict[str, list] = {field: [] for field in self.FIELDS}
+        for org in orgs:
+            for field, column in self.columns.items():
+                column.append(org[field])
+        self.haystacks = self.columns["_haystack"]
+
+    def __len__(self) -> int:
+        return len(self.haystacks)
+
+    def __getitem__(self, index: int) -> OrgView:
+        return OrgView(self, index)
+
+
+def parse_orgs(org_data: dict, verify: bool = False) -> OrgTable:
+    """Parse raw SF CLI org data into a unified, sorted table.
+
+    ``is_connected`` is None when the CLI did not report a status. With
+    ``verify``, every org instance is probed concurrently and unreachable
+    orgs are marked as disconnected. A reachable instance does not prove the
+    session is valid, so the probe never marks an org as connected.
+    """
     orgs = []
-    seen = set()
+    by_user: dict[str, dict] = {}
 
     all_orgs = (
         org_data.get("nonScratchOrgs", []) +
         org_data.get("scratchOrgs", [])
     )
 
+    # Keep the first record per username, unless a later one reports a status
     for org in all_orgs:
         username = org.get("username", "")
-        if username in seen:
-            continue
-        seen.add(username)
+        prev = by_user.get(username)
+        if prev is None or (not prev.get("connectedStatus") and org.get("connectedStatus")):
+            by_user[username] = org
 
+    for username, org in by_user.items():
         alias = org.get("alias", "-")
-        status = org.get("connectedStatus", "Unknown")
-        is_connected = status == "Connected"
+        status = org.get("connectedStatus") or "Unknown"
+        is_connected = None if status == "Unknown" else status == "Connected"
         org_type = get_org_type(org)
 
+        name = org.get("name", "-")
+
         orgs.append({
             "alias": alias,
             "username": username,
             "type": org_type,
-            "name": org.get("name", "-"),
+            "name": name,
             "status": status,
             "is_connected": is_connected,
             "instance_url": org.get("instanceUrl", ""),
             "is_default": org.get("isDefaultUsername", False),
             "is_dev_hub": org.get("isDevHub", False),
             "is_sandbox": org.get("isSandbox", False),
+            "_haystack": f"{alias}\x00{username}\x00{org_type}\x00{name}".lower(),
+            "_sort_key": (not is_connected, alias.lower()),
         })
 
-    orgs.sort(key=lambda x: (not x["is_connected"], x["alias"].lower()))
-    return orgs
-
+    if verify and orgs:
+        from concurrent.futures import ThreadPoolExecutor
 
-# =============================================================================
-# CUSTOM WIDGETS
-# =============================================================================
+        with ThreadPoolExecutor(max_workers=min(32, len(orgs))) as executor:
+            reachable = list(executor.map(probe_org, orgs))
+        for org, is_reachable in zip(orgs, reachable):
+            if not is_reachable:
+                org["is_connected"] = False
+                org["_sort_key"] = (True, org["_sort_key"][1])
 
-class StatsBar(Static):
-    """Displays connection statistics."""
+    orgs.sort(key=operator.itemgetter("_sort_key"))
+    return OrgTable(orgs)
 
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.connected = 0
-        self.expired = 0
-        self.total = 0
 
-    def update_stats(self, orgs: list[dict]) -> None:
-        self.total = len(orgs)
-        self.connected = sum(1 for o in orgs if o["is_connected"])
-        self.expired = self.total - self.connected
-        self.refresh_display()
+@lru_cache(maxsize=32)
+def compile_search(query: str) -> "re.Pattern[str]":
+    """Compile a multi-term query into a pattern that requires every term.
 
-    def refresh_display(self) -> None:
-        if self.total == 0:
-            self.update("No orgs found")
-        else:
-            parts = [f"[bold]{self.total}[/bold] orgs"]
-            if self.connected > 0:
-                parts.append(f"[green]● {self.connected} connected[/green]")
-            if self.expired > 0:
-                parts.append(f"[red]● {self.expired} expired[/red]")
-            self.update("  ".join(parts))
-
-
-class SearchInput(Input):
-    """Search input that appears when user presses /."""
-
-    DEFAULT_CSS = """
-    SearchInput {
-        width: 100%;
-        margin: 0;
-    }
+    Use with ``match()``: the lookaheads are anchored at the start, so a
+    haystack is scanned once per term rather than retried at every offset.
     """
-
-    def __init__(self, id: str = "search-input") -> None:
-        super().__init__(placeholder="Search orgs...", id=id)
+    return re.compile("".join(f"(?=.*{re.escape(term)})" for term in query.split()))
 
 
 # =============================================================================
-# MAIN APPLICATION
+# COMMAND LINE
 # =============================================================================
 
-TCSS = """
-Screen {
-    background: $surface;
-}
-
-#main-container {
-    width: 100%;
-    height: 100%;
-}
-
-#stats-bar {
-    dock: top;
-    height: 1;
-    padding: 0 1;
-    background: $primary-background;
-    color: $text;
-}
-
-#search-container {
-    dock: top;
-    height: auto;
-    display: none;
-    padding: 0 1;
-}
-
-#search-container.visible {
-    display: block;
-}
-
-#table-container {
-    width: 100%;
-    height: 1fr;
-    padding: 0 1;
-}
-
-DataTable {
-    height: 100%;
-}
-
-DataTable > .datatable--cursor {
-    background: $accent;
-    color: $text;
-}
-
-DataTable > .datatable--header {
-    background: $primary;
-    color: $text;
-    text-style: bold;
-}
-
-#loading-label {
-    width: 100%;
-    height: 100%;
-    content-align: center middle;
-    text-style: italic;
-    color: $text-muted;
-}
-
-#no-orgs-label {
-    width: 100%;
-    height: 100%;
-    content-align: center middle;
-    color: $warning;
-}
-
-Footer {
-    background: $primary-background;
-}
-"""
+LIST_FIELDS = ("is_connected", "alias", "type", "name", "username")
+STATUS_LABEL = {True: "connected", False: "expired", None: "unchecked"}
 
 
-class SFOrgsApp(App):
-    """Salesforce Org Manager - A beautiful terminal app."""
-
-    TITLE = "SF ORGS"
-    SUB_TITLE = "Salesforce Org Manager"
-    CSS = TCSS
-
-    BINDINGS = [
-        Binding("q", "quit", "Quit"),
-        Binding("r", "refresh", "Refresh"),
-        Binding("enter", "open_org", "Open", show=True),
-        Binding("o", "open_org", "Open", show=False),
-        Binding("a", "reauth", "Re-auth"),
-        Binding("slash", "search", "Search"),
-        Binding("escape", "clear_search", "Clear", show=False),
-        Binding("j", "cursor_down", "Down", show=False),
-        Binding("k", "cursor_up", "Up", show=False),
-    ]
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.orgs: list[dict] = []
-        self.filtered_orgs: list[dict] = []
-        self.search_query: str = ""
-
-    def compose(self) -> ComposeResult:
-        yield Header()
-        with Container(id="main-container"):
-            yield StatsBar(id="stats-bar")
-            with Container(id="search-container"):
-                yield SearchInput()
-            with Container(id="table-container"):
-                yield Label("Loading orgs...", id="loading-label")
-                yield DataTable(id="orgs-table", cursor_type="row")
-        yield Footer()
-
-    def on_mount(self) -> None:
-        """Called when app starts."""
-        table = self.query_one("#orgs-table", DataTable)
-        table.display = False
-        self.load_orgs()
-
-    @work(exclusive=True, thread=True)
-    def load_orgs(self) -> list[dict]:
-        """Load orgs in a background thread."""
-        try:
-            org_data = get_sf_orgs()
-            return parse_orgs(org_data)
-        except FileNotFoundError:
-            return []
-        except Exception:
-            return []
-
-    @on(Worker.StateChanged)
-    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
-        """Handle worker completion for load_orgs only."""
-        if event.state == WorkerState.SUCCESS and event.worker.name == "load_orgs":
-            self.orgs = event.worker.result or []
-            self.filtered_orgs = self.orgs.copy()
-            self.populate_table()
-
-    def populate_table(self) -> None:
-        """Populate the DataTable with org data."""
-        loading = self.query_one("#loading-label", Label)
-        table = self.query_one("#orgs-table", DataTable)
-        stats = self.query_one("#stats-bar", StatsBar)
-
-        loading.display = False
-        table.display = True
-
-        table.clear(columns=True)
-
-        if not self.filtered_orgs:
-            if self.search_query:
-                loading.update("No matching orgs found")
-            else:
-                loading.update("No authenticated orgs. Run: sf org login web")
-            loading.display = True
-            table.display = False
-            stats.update_stats([])
-            return
-
-        stats.update_stats(self.orgs)
-
-        table.add_column("", key="status", width=3)
-        table.add_column("Alias", key="alias", width=20)
-        table.add_column("Type", key="type", width=12)
-        table.add_column("Name", key="name", width=20)
-        table.add_column("Username", key="username")
-
-        for org in self.filtered_orgs:
-            status_icon = "[green]●[/green]" if org["is_connected"] else "[red]●[/red]"
-
-            alias_text = org["alias"]
-            if org["is_default"]:
-                alias_text += " [yellow]★[/yellow]"
-            if org["is_dev_hub"]:
-                alias_text += " [magenta]⬡[/magenta]"
-
-            type_colors = {
-                "Sandbox": "yellow",
-                "Dev Hub": "magenta",
-                "Scratch": "cyan",
-                "Production": "green",
-            }
-            type_color = type_colors.get(org["type"], "white")
-            type_text = f"[{type_color}]{org['type']}[/{type_color}]"
-
-            name = org["name"][:18] + ".." if len(org["name"]) > 20 else org["name"]
-
-            table.add_row(
-                status_icon,
-                alias_text,
-                type_text,
-                name,
-                org["username"],
-                key=org["username"],
-            )
-
-    def get_selected_org(self) -> Optional[dict]:
-        """Get the currently selected org."""
-        table = self.query_one("#orgs-table", DataTable)
-        if table.cursor_row is not None and table.cursor_row < len(self.filtered_orgs):
-            return self.filtered_orgs[table.cursor_row]
-        return None
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="sforgs",
+        description="Terminal user interface for Salesforce org management",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="ignore the cached org list and query the SF CLI",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="probe each org instance to confirm it is reachable",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="print orgs as tab-separated lines instead of starting the TUI",
+    )
+    return parser.parse_args(argv)
 
-    def action_open_org(self) -> None:
-        """Open the selected org in browser."""
-        org = self.get_selected_org()
-        if not org:
-            self.notify("No org selected", severity="warning")
-            return
-
-        if not org["is_connected"]:
-            self.notify("Session expired - press 'a' to re-authenticate", severity="warning")
-            return
-
-        alias_or_username = org["alias"] if org["alias"] != "-" else org["username"]
-        self.notify(f"Opening {alias_or_username}...", severity="information")
-        self.run_open_org(alias_or_username)
-
-    @work(thread=True)
-    def run_open_org(self, alias_or_username: str) -> None:
-        """Run org open in background thread."""
-        success, message = open_org(alias_or_username)
-        self.call_from_thread(
-            self.notify,
-            message,
-            severity="information" if success else "error"
-        )
 
-    def action_reauth(self) -> None:
-        """Re-authenticate the selected org."""
-        org = self.get_selected_org()
-        if not org:
-            self.notify("No org selected", severity="warning")
-            return
-
-        alias_or_username = org["alias"] if org["alias"] != "-" else org["username"]
-        self.notify(f"Opening login page for {alias_or_username}...", severity="information")
-        self.run_reauth_org(alias_or_username, org["is_sandbox"])
-
-    @work(thread=True)
-    def run_reauth_org(self, alias_or_username: str, is_sandbox: bool) -> None:
-        """Run re-auth in background thread."""
-        success, message = reauth_org(alias_or_username, is_sandbox)
-        self.call_from_thread(
-            self.notify,
-            message,
-            severity="information" if success else "error"
-        )
-        if success:
-            self.call_from_thread(self.load_orgs)
-
-    def action_refresh(self) -> None:
-        """Refresh the org list."""
-        loading = self.query_one("#loading-label", Label)
-        table = self.query_one("#orgs-table", DataTable)
-
-        loading.update("Refreshing...")
-        loading.display = True
-        table.display = False
-
-        self.notify("Refreshing orgs...", severity="information")
-        self.load_orgs()
-
-    def action_search(self) -> None:
-        """Show search input."""
-        search_container = self.query_one("#search-container")
-        search_input = self.query_one("#search-input", Input)
-        search_container.add_class("visible")
-        search_input.focus()
-
-    def action_clear_search(self) -> None:
-        """Clear search and hide input."""
-        search_container = self.query_one("#search-container")
-        search_input = self.query_one("#search-input", Input)
-        search_input.value = ""
-        search_container.remove_class("visible")
-        self.search_query = ""
-        self.filtered_orgs = self.orgs.copy()
-        self.populate_table()
-        self.query_one("#orgs-table", DataTable).focus()
-
-    @on(Input.Changed, "#search-input")
-    def on_search_changed(self, event: Input.Changed) -> None:
-        """Filter orgs based on search query."""
-        self.search_query = event.value.lower()
-        if not self.search_query:
-            self.filtered_orgs = self.orgs.copy()
-        else:
-            self.filtered_orgs = [
-                org for org in self.orgs
-                if (self.search_query in org["alias"].lower() or
-                    self.search_query in org["username"].lower() or
-                    self.search_query in org["type"].lower() or
-                    self.search_query in org["name"].lower())
-            ]
-        self.populate_table()
-
-    @on(Input.Submitted, "#search-input")
-    def on_search_submitted(self, event: Input.Submitted) -> None:
-        """Focus table after search submit."""
-        self.query_one("#orgs-table", DataTable).focus()
-
-    def action_cursor_down(self) -> None:
-        """Move cursor down (vim-style)."""
-        table = self.query_one("#orgs-table", DataTable)
-        table.action_cursor_down()
-
-    def action_cursor_up(self) -> None:
-        """Move cursor up (vim-style)."""
-        table = self.query_one("#orgs-table", DataTable)
-        table.action_cursor_up()
-
-    @on(DataTable.RowSelected)
-    def on_row_selected(self, event: DataTable.RowSelected) -> None:
-        """Handle double-click on row."""
-        self.action_open_org()
+def print_orgs(fresh: bool = False, verify: bool = False) -> int:
+    """Print orgs as tab-separated lines for scripts. Returns an exit code."""
+    try:
+        org_data, is_stale = asyncio.run(get_sf_orgs(skip_cache=fresh))
+    except FileNotFoundError:
+        print("sforgs: Salesforce CLI (sf) not found", file=sys.stderr)
+        return 1
+    except asyncio.TimeoutError:
+        print("sforgs: timed out listing orgs", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"sforgs: could not list orgs: {e}", file=sys.stderr)
+        return 1
+    if is_stale:
+        print("sforgs: SF CLI unavailable - using stale cache", file=sys.stderr)
+
+    orgs = parse_orgs(org_data, verify=verify)
+    columns = [orgs.columns[field] for field in LIST_FIELDS]
+    try:
+        for status, *fields in zip(*columns):
+            print("\t".join([STATUS_LABEL[status], *fields]))
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `sforgs --list | head`); silence the
+        # flush Python attempts at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
 
 
 def main() -> None:
     """Main entry point."""
+    args = parse_args()
+    if args.list:
+        sys.exit(print_orgs(fresh=args.fresh, verify=args.verify))
+
+    # Start listing orgs while Textual loads, unless the cache will serve it
+    prefetch = None
+    if args.fresh or read_cache() is None:
+        try:
+            prefetch = start_org_list(SKIP_STATUS_FLAG)
+        except FileNotFoundError:
+            pass
+
+    from sforgs_tui import SFOrgsApp
+
     try:
-        app = SFOrgsApp()
+        app = SFOrgsApp(fresh=args.fresh, verify=args.verify, prefetch=prefetch)
         app.run()
     except KeyboardInterrupt:
         pass
+    finally:
+        if prefetch is not None and prefetch.poll() is None:
+            prefetch.kill()
 
 
 if __name__ == "__main__":
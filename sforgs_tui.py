@@ -0,0 +1,587 @@
+"""
+SF Orgs - Textual interface
+
+Widgets, styling and the main application class. Imported lazily by
+`sforgs.main()` so that non-interactive use never loads Textual.
+"""
+
+import asyncio
+import subprocess
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from textual import on, work
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.containers import Container, Horizontal, Vertical
+from textual.timer import Timer
+from textual.widgets import DataTable, Footer, Header, Input, Label, Static
+
+from sforgs import (
+    OrgTable,
+    OrgView,
+    check_org,
+    compile_search,
+    get_sf_orgs,
+    open_org,
+    parse_orgs,
+    read_cache,
+    reauth_org,
+    warmup_cli,
+)
+
+
+# =============================================================================
+# CUSTOM WIDGETS
+# =============================================================================
+
+class StatsBar(Static):
+    """Displays connection statistics."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.connected = 0
+        self.expired = 0
+        self.unknown = 0
+        self.total = 0
+
+    def update_stats(self, orgs: OrgTable) -> None:
+        is_connected = orgs.columns["is_connected"]
+        self.total = len(orgs)
+        self.connected = sum(1 for c in is_connected if c)
+        self.unknown = sum(1 for c in is_connected if c is None)
+        self.expired = self.total - self.connected - self.unknown
+        self.refresh_display()
+
+    def refresh_display(self) -> None:
+        if self.total == 0:
+            self.update("No orgs found")
+        else:
+            parts = [f"[bold]{self.total}[/bold] orgs"]
+            if self.connected > 0:
+                parts.append(f"[green]● {self.connected} connected[/green]")
+            if self.expired > 0:
+                parts.append(f"[red]● {self.expired} expired[/red]")
+            if self.unknown > 0:
+                parts.append(f"[dim]● {self.unknown} unchecked[/dim]")
+            self.update("  ".join(parts))
+
+
+class SearchInput(Input):
+    """Search input that appears when user presses /."""
+
+    DEFAULT_CSS = """
+    SearchInput {
+        width: 100%;
+        margin: 0;
+    }
+    """
+
+    def __init__(self, id: str = "search-input") -> None:
+        super().__init__(placeholder="Search orgs...", id=id)
+
+
+# =============================================================================
+# MAIN APPLICATION
+# =============================================================================
+
+TCSS = """
+Screen {
+    background: $surface;
+}
+
+#main-container {
+    width: 100%;
+    height: 100%;
+}
+
+#stats-bar {
+    dock: top;
+    height: 1;
+    padding: 0 1;
+    background: $primary-background;
+    color: $text;
+}
+
+#search-container {
+    dock: top;
+    height: auto;
+    display: none;
+    padding: 0 1;
+}
+
+#search-container.visible {
+    display: block;
+}
+
+#table-container {
+    width: 100%;
+    height: 1fr;
+    padding: 0 1;
+}
+
+DataTable {
+    height: 100%;
+}
+
+DataTable > .datatable--cursor {
+    background: $accent;
+    color: $text;
+}
+
+DataTable > .datatable--header {
+    background: $primary;
+    color: $text;
+    text-style: bold;
+}
+
+#loading-label {
+    width: 100%;
+    height: 100%;
+    content-align: center middle;
+    text-style: italic;
+    color: $text-muted;
+}
+
+#no-orgs-label {
+    width: 100%;
+    height: 100%;
+    content-align: center middle;
+    color: $warning;
+}
+
+Footer {
+    background: $primary-background;
+}
+"""
+
+
+ROW_COLUMNS = ("status", "alias", "type", "name", "username")
+
+TYPE_COLORS = {
+    "Sandbox": "yellow",
+    "Dev Hub": "magenta",
+    "Scratch": "cyan",
+    "Production": "green",
+}
+TYPE_TEXT = {t: f"[{c}]{t}[/{c}]" for t, c in TYPE_COLORS.items()}
+STATUS_ICON = {  # keyed by is_connected
+    True: "[green]●[/green]",
+    False: "[red]●[/red]",
+    None: "[dim]●[/dim]",
+}
+
+
+@lru_cache(maxsize=1024)
+def format_row(
+    is_connected: Optional[bool],
+    alias: str,
+    is_default: bool,
+    is_dev_hub: bool,
+    org_type: str,
+    name: str,
+    username: str,
+) -> tuple[str, ...]:
+    """Build the cell markup for an org, in column order.
+
+    Memoised so rows shown again after a search or refresh reuse their markup.
+    """
+    alias_text = alias
+    if is_default:
+        alias_text += " [yellow]★[/yellow]"
+    if is_dev_hub:
+        alias_text += " [magenta]⬡[/magenta]"
+
+    name = name[:18] + ".." if len(name) > 20 else name
+
+    return (
+        STATUS_ICON[is_connected],
+        alias_text,
+        TYPE_TEXT.get(org_type, org_type),
+        name,
+        username,
+    )
+
+
+SEARCH_DEBOUNCE = 0.04  # seconds
+SEARCH_DEBOUNCE_MIN_ORGS = 50
+
+
+class SFOrgsApp(App):
+    """Salesforce Org Manager - A beautiful terminal app.
+
+    ``filtered`` holds the row indices into ``orgs`` that match the search;
+    it is a plain range when no search is active, so treat it as read-only.
+    """
+
+    TITLE = "SF ORGS"
+    SUB_TITLE = "Salesforce Org Manager"
+    CSS = TCSS
+
+    BINDINGS = [
+        Binding("q", "quit", "Quit"),
+        Binding("r", "refresh", "Refresh"),
+        Binding("enter", "open_org", "Open", show=True),
+        Binding("o", "open_org", "Open", show=False),
+        Binding("a", "reauth", "Re-auth"),
+        Binding("slash", "search", "Search"),
+        Binding("escape", "clear_search", "Clear", show=False),
+        Binding("j", "cursor_down", "Down", show=False),
+        Binding("k", "cursor_up", "Up", show=False),
+    ]
+
+    def __init__(
+        self,
+        fresh: bool = False,
+        verify: bool = False,
+        prefetch: Optional[subprocess.Popen] = None,
+    ) -> None:
+        super().__init__()
+        self.fresh = fresh
+        self.verify = verify
+        self.prefetch = prefetch
+        self.orgs = OrgTable()
+        self.filtered: Sequence[int] = range(0)
+        self.search_query: str = ""
+        self._filter_timer: Optional[Timer] = None
+        self._row_source = self.orgs
+        self._row_index: dict[str, int] = {}
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        with Container(id="main-container"):
+            yield StatsBar(id="stats-bar")
+            with Container(id="search-container"):
+                yield SearchInput()
+            with Container(id="table-container"):
+                yield Label("Loading orgs...", id="loading-label")
+                yield DataTable(id="orgs-table", cursor_type="row")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Called when app starts."""
+        table = self.query_one("#orgs-table", DataTable)
+        table.display = False
+        self._init_columns()
+        if self.prefetch is not None:
+            # The prefetched org list warms the CLI as well
+            self.load_orgs(process=self.prefetch)
+            self.prefetch = None
+        else:
+            self.load_orgs(skip_cache=self.fresh)
+            self.run_warmup()
+
+    @work(thread=True)
+    def run_warmup(self) -> None:
+        """Warm up the SF CLI in a background thread."""
+        warmup_cli()
+
+    def load_orgs(
+        self,
+        skip_cache: bool = False,
+        process: Optional[subprocess.Popen] = None,
+    ) -> None:
+        """Load orgs in a worker, replacing any load already in progress."""
+        self.run_worker(
+            self._load_and_populate(skip_cache, process),
+            name="load_orgs",
+            group="load_orgs",
+            exclusive=True,
+        )
+
+    async def _load_and_populate(
+        self,
+        skip_cache: bool,
+        process: Optional[subprocess.Popen],
+    ) -> None:
+        """Fetch and parse orgs without blocking the UI, then show them.
+
+        While a started ``process`` runs, the last cached list (however old)
+        is shown so the table is usable before the CLI answers, unless the
+        app was started with ``--fresh``. Cancelling
+        the worker (refresh, quit) kills the CLI process.
+        """
+        try:
+            if process is not None and not self.fresh and not self.orgs:
+                cached = await asyncio.to_thread(read_cache, None)
+                if cached is not None:
+                    self.show_orgs(await asyncio.to_thread(parse_orgs, cached))
+            org_data, is_stale = await get_sf_orgs(skip_cache, process)
+            if is_stale:
+                self.notify("SF CLI unavailable - using stale cache", severity="warning")
+            orgs = await asyncio.to_thread(parse_orgs, org_data, self.verify)
+        except FileNotFoundError:
+            orgs = OrgTable()
+        except Exception:
+            orgs = OrgTable()
+        self.show_orgs(orgs)
+
+    def show_orgs(self, orgs: OrgTable) -> None:
+        """Replace the org list, keeping the current search applied."""
+        self.orgs = orgs
+        self.apply_filter()
+
+    def _init_columns(self) -> None:
+        """Add the table columns. Called once; rows are synced afterwards."""
+        table = self.query_one("#orgs-table", DataTable)
+        table.add_column("", key="status", width=3)
+        table.add_column("Alias", key="alias", width=20)
+        table.add_column("Type", key="type", width=12)
+        table.add_column("Name", key="name", width=20)
+        table.add_column("Username", key="username")
+
+    def populate_table(self) -> None:
+        """Populate the DataTable with org data."""
+        loading = self.query_one("#loading-label", Label)
+        table = self.query_one("#orgs-table", DataTable)
+        stats = self.query_one("#stats-bar", StatsBar)
+
+        self._sync_rows(self.orgs, self.filtered)
+
+        if not self.filtered:
+            if self.search_query:
+                loading.update("No matching orgs found")
+            else:
+                loading.update("No authenticated orgs. Run: sf org login web")
+            loading.display = True
+            table.display = False
+            stats.update_stats(OrgTable())
+            return
+
+        loading.display = False
+        table.display = True
+        stats.update_stats(self.orgs)
+
+    @staticmethod
+    def _format_row(org: OrgView) -> tuple[str, ...]:
+        """Build the cell values for an org, in column order."""
+        return format_row(
+            org["is_connected"],
+            org["alias"],
+            org["is_default"],
+            org["is_dev_hub"],
+            org["type"],
+            org["name"],
+            org["username"],
+        )
+
+    def _sync_rows(self, orgs: OrgTable, indices: Sequence[int]) -> None:
+        """Diff the displayed rows against ``orgs[indices]`` by username.
+
+        Only rows that appeared, disappeared or changed are touched; rows from
+        the same table as last time are known to be unchanged. Rows are
+        re-sorted to match ``indices`` only when rows were added next to or
+        updated among existing ones; removals preserve the order.
+        """
+        table = self.query_one("#orgs-table", DataTable)
+        usernames = orgs.columns["username"]
+        rows = {usernames[index]: index for index in indices}
+
+        removed = self._row_index.keys() - rows.keys()
+        if len(removed) == len(self._row_index):
+            table.clear()
+            self._row_index = {}
+        else:
+            for key in removed:
+                table.remove_row(key)
+
+        same_source = orgs is self._row_source
+        reorder = False
+        for key, index in rows.items():
+            shown = self._row_index.get(key)
+            if shown is None:
+                table.add_row(*self._format_row(orgs[index]), key=key)
+                reorder = reorder or bool(self._row_index)
+            elif not same_source:
+                old_cells = self._format_row(self._row_source[shown])
+                new_cells = self._format_row(orgs[index])
+                for column, old, new in zip(ROW_COLUMNS, old_cells, new_cells):
+                    if old != new:
+                        table.update_cell(key, column, new)
+                reorder = True
+
+        if reorder:
+            order = {key: position for position, key in enumerate(rows)}
+            table.sort("username", key=order.__getitem__)
+        self._row_source = orgs
+        self._row_index = rows
+
+    def get_selected_org(self) -> Optional[OrgView]:
+        """Get the currently selected org."""
+        table = self.query_one("#orgs-table", DataTable)
+        if table.cursor_row is not None and table.cursor_row < len(self.filtered):
+            return self.orgs[self.filtered[table.cursor_row]]
+        return None
+
+    def action_open_org(self) -> None:
+        """Open the selected org in browser."""
+        org = self.get_selected_org()
+        if not org:
+            self.notify("No org selected", severity="warning")
+            return
+
+        if org["is_connected"] is False:
+            self.notify("Session expired - press 'a' to re-authenticate", severity="warning")
+            return
+
+        alias_or_username = org["alias"] if org["alias"] != "-" else org["username"]
+        if org["is_connected"] is None:
+            self.notify(f"Checking {alias_or_username}...", severity="information")
+            self.run_check_and_open_org(org, alias_or_username)
+            return
+
+        self.notify(f"Opening {alias_or_username}...", severity="information")
+        self.run_open_org(alias_or_username)
+
+    @work(thread=True)
+    def run_check_and_open_org(self, org: OrgView, alias_or_username: str) -> None:
+        """Confirm the org session in background thread, then open it."""
+        is_connected = check_org(alias_or_username)
+        if is_connected is not None:
+            self.call_from_thread(self.set_org_status, org, is_connected)
+        if is_connected is False:
+            self.call_from_thread(
+                self.notify,
+                "Session expired - press 'a' to re-authenticate",
+                severity="warning"
+            )
+            return
+
+        success, message = open_org(alias_or_username)
+        self.call_from_thread(
+            self.notify,
+            message,
+            severity="information" if success else "error"
+        )
+
+    def set_org_status(self, org: OrgView, is_connected: bool) -> None:
+        """Record a confirmed connection status and update its row."""
+        org["is_connected"] = is_connected
+        org["status"] = "Connected" if is_connected else "Disconnected"
+        shown = org.table is self._row_source
+        if shown and self._row_index.get(org["username"]) == org.index:
+            table = self.query_one("#orgs-table", DataTable)
+            table.update_cell(org["username"], "status", STATUS_ICON[is_connected])
+        self.query_one("#stats-bar", StatsBar).update_stats(self.orgs)
+
+    @work(thread=True)
+    def run_open_org(self, alias_or_username: str) -> None:
+        """Run org open in background thread."""
+        success, message = open_org(alias_or_username)
+        self.call_from_thread(
+            self.notify,
+            message,
+            severity="information" if success else "error"
+        )
+
+    def action_reauth(self) -> None:
+        """Re-authenticate the selected org."""
+        org = self.get_selected_org()
+        if not org:
+            self.notify("No org selected", severity="warning")
+            return
+
+        alias_or_username = org["alias"] if org["alias"] != "-" else org["username"]
+        self.notify(f"Opening login page for {alias_or_username}...", severity="information")
+        self.run_reauth_org(alias_or_username, org["is_sandbox"])
+
+    @work(thread=True)
+    def run_reauth_org(self, alias_or_username: str, is_sandbox: bool) -> None:
+        """Run re-auth in background thread."""
+        success, message = reauth_org(alias_or_username, is_sandbox)
+        self.call_from_thread(
+            self.notify,
+            message,
+            severity="information" if success else "error"
+        )
+        if success:
+            self.call_from_thread(self.load_orgs, skip_cache=True)
+
+    def action_refresh(self) -> None:
+        """Refresh the org list."""
+        loading = self.query_one("#loading-label", Label)
+        table = self.query_one("#orgs-table", DataTable)
+
+        loading.update("Refreshing...")
+        loading.display = True
+        table.display = False
+
+        self.notify("Refreshing orgs...", severity="information")
+        self.load_orgs(skip_cache=True)
+
+    def action_search(self) -> None:
+        """Show search input."""
+        search_container = self.query_one("#search-container")
+        search_input = self.query_one("#search-input", Input)
+        search_container.add_class("visible")
+        search_input.focus()
+
+    def action_clear_search(self) -> None:
+        """Clear search and hide input."""
+        search_container = self.query_one("#search-container")
+        search_input = self.query_one("#search-input", Input)
+        search_input.value = ""
+        search_container.remove_class("visible")
+        self.search_query = ""
+        self.apply_filter()
+        self.query_one("#orgs-table", DataTable).focus()
+
+    @on(Input.Changed, "#search-input")
+    def on_search_changed(self, event: Input.Changed) -> None:
+        """Filter orgs based on search query.
+
+        Keystrokes within a short window are coalesced into a single filter
+        pass, except when clearing the query or for short org lists.
+        """
+        self.search_query = event.value.lower()
+        self._cancel_filter_timer()
+        if not self.search_query or len(self.orgs) < SEARCH_DEBOUNCE_MIN_ORGS:
+            self.apply_filter()
+        else:
+            self._filter_timer = self.set_timer(SEARCH_DEBOUNCE, self.apply_filter)
+
+    def _cancel_filter_timer(self) -> None:
+        """Drop a pending debounced filter pass."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
+
+    def apply_filter(self) -> None:
+        """Filter orgs by the current search query and refresh the table."""
+        self._cancel_filter_timer()
+        terms = self.search_query.split()
+        if not terms:
+            self.filtered = range(len(self.orgs))
+        elif len(terms) == 1:
+            term = terms[0]
+            self.filtered = [
+                index for index, haystack in enumerate(self.orgs.haystacks)
+                if term in haystack
+            ]
+        else:
+            match = compile_search(self.search_query).match
+            self.filtered = [
+                index for index, haystack in enumerate(self.orgs.haystacks)
+                if match(haystack)
+            ]
+        self.populate_table()
+
+    @on(Input.Submitted, "#search-input")
+    def on_search_submitted(self, event: Input.Submitted) -> None:
+        """Focus table after search submit."""
+        self.query_one("#orgs-table", DataTable).focus()
+
+    def action_cursor_down(self) -> None:
+        """Move cursor down (vim-style)."""
+        table = self.query_one("#orgs-table", DataTable)
+        table.action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        """Move cursor up (vim-style)."""
+        table = self.query_one("#orgs-table", DataTable)
+        table.action_cursor_up()
+
+    @on(DataTable.RowSelected)
+    def on_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Handle double-click on row."""
+        self.action_open_org()